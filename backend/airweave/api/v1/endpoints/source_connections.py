@@ -11,12 +11,14 @@ Key operations:
 - Update connection settings and credentials
 """
 
+import hashlib
 import logging
 from typing import List, Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from uuid import UUID
 
-from fastapi import Depends, Path, Query, Response
+from fastapi import Depends, Path, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import schemas
@@ -44,6 +46,9 @@ logger = logging.getLogger(__name__)
 
 router = TrailingSlashRouter()
 
+# Reused for the jobs endpoint so polling clients can revalidate with ETags
+_JOB_LIST_ADAPTER: TypeAdapter = TypeAdapter(List[schemas.SourceConnectionJob])
+
 
 # OAuth callback endpoints
 @router.get("/callback")
@@ -484,6 +489,7 @@ Job statuses:
 )
 async def get_source_connection_jobs(
     *,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     source_connection_id: UUID = Path(
         ...,
@@ -501,14 +507,27 @@ async def get_source_connection_jobs(
     source_connection_service: SourceConnectionServiceProtocol = Inject(
         SourceConnectionServiceProtocol
     ),
-) -> List[schemas.SourceConnectionJob]:
-    """Get sync jobs for a source connection."""
-    return await source_connection_service.get_jobs(
+) -> Response:
+    """Get sync jobs for a source connection.
+
+    Returns an ``ETag`` over the serialized job list so polling clients can
+    revalidate with ``If-None-Match`` and receive an empty 304 instead of the
+    full payload while nothing has changed.
+    """
+    jobs = await source_connection_service.get_jobs(
         db,
         id=source_connection_id,
         ctx=ctx,
         limit=limit,
     )
+    payload = _JOB_LIST_ADAPTER.dump_json(jobs)
+    etag = f'"{hashlib.sha256(payload).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache, must-revalidate"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.post(
@@ -8,7 +8,7 @@ synchronized with Airweave.
 
 from typing import List
 
-from fastapi import Depends, Path
+from fastapi import Depends, Path, Response
 
 from airweave import schemas
 from airweave.api import deps
@@ -46,9 +46,15 @@ async def list(
     *,
     ctx: ApiContext = Depends(deps.get_context),
     source_service: SourceServiceProtocol = Inject(SourceServiceProtocol),
-) -> List[schemas.Source]:
-    """List all available data source connectors."""
-    return await source_service.list(ctx)
+) -> Response:
+    """List all available data source connectors.
+
+    Returns the service's cached, pre-serialized payload directly so FastAPI
+    skips re-validating the full catalog against the response model on every
+    request.
+    """
+    payload = await source_service.list_serialized(ctx)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
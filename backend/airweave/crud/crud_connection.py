@@ -109,7 +109,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             .limit(limit)
         )
         user_result = await db.execute(user_query)
-        user_connections = list(user_result.unique().scalars().all())
+        user_connections = user_result.unique().scalars().all()
 
         # Get native connections
         native_query = select(self.model).where(
@@ -122,7 +122,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             ),
         )
         native_result = await db.execute(native_query)
-        native_connections = list(native_result.unique().scalars().all())
+        native_connections = native_result.unique().scalars().all()
 
         # Combine and return all connections
         return user_connections + native_connections
@@ -153,7 +153,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             )
         )
         org_result = await db.execute(org_query)
-        org_connections = list(org_result.scalars().all())
+        org_connections = org_result.scalars().all()
 
         # Query for native connections of the same integration type
         native_query = (
@@ -171,7 +171,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             )
         )
         native_result = await db.execute(native_query)
-        native_connections = list(native_result.scalars().all())
+        native_connections = native_result.scalars().all()
 
         # Combine the results
         return org_connections + native_connections
@@ -202,7 +202,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             )
         )
         org_result = await db.execute(org_query)
-        org_connections = list(org_result.scalars().all())
+        org_connections = org_result.scalars().all()
 
         # Query for native connections with the same short name
         native_query = (
@@ -220,7 +220,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             )
         )
         native_result = await db.execute(native_query)
-        native_connections = list(native_result.scalars().all())
+        native_connections = native_result.scalars().all()
 
         # Combine the results
         return org_connections + native_connections
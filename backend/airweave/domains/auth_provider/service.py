@@ -337,9 +337,14 @@ class AuthProviderService(AuthProviderServiceProtocol):
             if not connection.integration_credential_id:
                 return None
 
-            credential = await self._credential_repo.get(
-                db, id=connection.integration_credential_id, ctx=ctx
-            )
+            # Use the credential eager-loaded by selectinload when present
+            # (list paths batch-load it in one IN-query); only fall back to a
+            # per-connection lookup for rows fetched without it.
+            credential = getattr(connection, "integration_credential", None)
+            if credential is None:
+                credential = await self._credential_repo.get(
+                    db, id=connection.integration_credential_id, ctx=ctx
+                )
             if not credential:
                 return None
 
@@ -38,6 +38,14 @@ class FakeSourceService:
         """List all sources."""
         return list(self._sources.values())
 
+    async def list_serialized(self, *args, **kwargs) -> bytes:
+        """List all sources as serialized JSON bytes."""
+        from pydantic import TypeAdapter
+
+        from airweave import schemas as _schemas
+
+        return TypeAdapter(list[_schemas.Source]).dump_json(list(self._sources.values()))
+
     # Test helpers
 
     def seed(self, *sources: schemas.Source) -> None:
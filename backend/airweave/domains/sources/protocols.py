@@ -25,6 +25,10 @@ class SourceServiceProtocol(Protocol):
         """List all sources."""
         ...
 
+    async def list_serialized(self, ctx: ApiContext) -> bytes:
+        """List all sources as a pre-serialized JSON payload."""
+        ...
+
 
 class SourceRegistryProtocol(RegistryProtocol[SourceRegistryEntry], Protocol):
     """Source registry protocol."""
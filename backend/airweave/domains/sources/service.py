@@ -1,5 +1,9 @@
 """Source service."""
 
+import time
+
+from pydantic import TypeAdapter
+
 from airweave import schemas
 from airweave.api.context import ApiContext
 from airweave.core.config.settings import Settings
@@ -11,6 +15,16 @@ from airweave.domains.sources.protocols import (
 )
 from airweave.domains.sources.types import SourceRegistryEntry
 
+# How long a converted source list is served before being rebuilt. Registry
+# entries are fixed after startup and the response only varies by the org's
+# enabled features (part of the cache key), so the TTL mainly bounds memory
+# held for feature sets that are no longer requested.
+_LIST_CACHE_TTL_SECONDS = 300.0
+
+# Serializer for the list payload, compiled once (pydantic-core renders the
+# JSON in Rust, without a per-request jsonable_encoder pass).
+_SOURCE_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[schemas.Source])
+
 
 class SourceService(SourceServiceProtocol):
     """Service for managing sources.
@@ -27,6 +41,12 @@ class SourceService(SourceServiceProtocol):
         """Initialize the source service."""
         self.source_registry = source_registry
         self.settings = settings
+        self._list_cache: dict[frozenset, tuple[float, list[schemas.Source]]] = {}
+        self._payload_cache: dict[frozenset, tuple[float, bytes]] = {}
+        # Memoized entry -> schema conversions, keyed by (short_name, feature set).
+        # Registry entries and settings are fixed after startup, so a conversion
+        # is pure in those two inputs and never goes stale.
+        self._schema_cache: dict[tuple[str, frozenset], schemas.Source] = {}
 
     async def get(self, short_name: str, ctx: ApiContext) -> schemas.Source:
         """Get a source by short name."""
@@ -44,9 +64,20 @@ class SourceService(SourceServiceProtocol):
 
     async def list(self, ctx: ApiContext) -> list[schemas.Source]:
         """List all sources."""
-        entries = self.source_registry.list_all()
         enabled_features = ctx.organization.enabled_features or []
 
+        # Orgs with the same feature set get the same catalog, so serve the
+        # converted schemas from cache instead of re-validating ~50 entries
+        # per request.
+        cache_key = frozenset(enabled_features)
+        cached = self._list_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL_SECONDS:
+            result_sources = cached[1]
+            ctx.logger.info(f"Returning {len(result_sources)} sources")
+            return result_sources
+
+        entries = self.source_registry.list_all()
+
         result_sources = []
         for entry in entries:
             if self._is_hidden_by_feature_flag(entry, enabled_features, ctx):
@@ -54,9 +85,28 @@ class SourceService(SourceServiceProtocol):
             mapped_schema = self._entry_to_schema(entry, enabled_features)
             result_sources.append(mapped_schema)
 
+        self._list_cache[cache_key] = (time.monotonic(), result_sources)
+
         ctx.logger.info(f"Returning {len(result_sources)} sources")
         return result_sources
 
+    async def list_serialized(self, ctx: ApiContext) -> bytes:
+        """List all sources as a pre-serialized JSON payload.
+
+        Serialization runs at most once per (feature set, TTL window); the API
+        layer returns these bytes directly, skipping per-request response-model
+        re-validation of the whole catalog.
+        """
+        enabled_features = ctx.organization.enabled_features or []
+        cache_key = frozenset(enabled_features)
+        cached = self._payload_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        payload = _SOURCE_LIST_ADAPTER.dump_json(await self.list(ctx))
+        self._payload_cache[cache_key] = (time.monotonic(), payload)
+        return payload
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -67,8 +117,14 @@ class SourceService(SourceServiceProtocol):
         """Convert a registry entry to an API schema.
 
         Applies per-request concerns: feature-flag filtering of config fields,
-        and self-hosted requires_byoc override.
+        and self-hosted requires_byoc override. Conversions are memoized per
+        (source, feature set) since both inputs are fixed after startup.
         """
+        cache_key = (entry.short_name, frozenset(enabled_features))
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Filter config fields by the organization's enabled features
         config_fields = entry.config_fields.filter_by_features(enabled_features)
 
@@ -104,6 +160,7 @@ class SourceService(SourceServiceProtocol):
         except Exception as e:
             raise ValueError(f"Error validating source {entry.short_name}: {e}")
 
+        self._schema_cache[cache_key] = schema
         return schema
 
     def _is_hidden_by_feature_flag(
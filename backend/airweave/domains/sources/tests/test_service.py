@@ -131,6 +131,29 @@ async def test_list(case: ListCase):
     assert {s.short_name for s in result} == case.expect_visible
 
 
+# ---------------------------------------------------------------------------
+# list() caching
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_list_serves_cached_result_per_feature_set():
+    registry = FakeSourceRegistry()
+    registry.seed(_make_entry("slack", "Slack"))
+    service = SourceService(source_registry=registry, settings=_make_settings())
+    ctx = _make_ctx()
+
+    assert {s.short_name for s in await service.list(ctx)} == {"slack"}
+    registry.seed(_make_entry("github", "Github"))
+
+    # Same feature set: served from cache, new registry entry not visible yet
+    assert {s.short_name for s in await service.list(ctx)} == {"slack"}
+
+    # A different feature set misses the cache and sees the fresh registry state
+    other_ctx = _make_ctx(enabled_features=[FeatureFlag.SHAREPOINT_2019_V2])
+    assert {s.short_name for s in await service.list(other_ctx)} == {"slack", "github"}
+
+
 # ---------------------------------------------------------------------------
 # Self-hosted BYOC override
 # ---------------------------------------------------------------------------
@@ -98,6 +98,10 @@ class Connection(Base):
         ),
         Index("idx_connection_organization_id", "organization_id"),
         Index("idx_connection_integration_credential_id", "integration_credential_id"),
+        # Composite indexes matching the CRUD query shapes: filtering an org's
+        # connections by integration type (optionally status) and by short name
+        Index("idx_connection_org_type_status", "organization_id", "integration_type", "status"),
+        Index("idx_connection_org_short_name", "organization_id", "short_name"),
     )
 
 
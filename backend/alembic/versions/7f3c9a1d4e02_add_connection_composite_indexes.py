@@ -0,0 +1,52 @@
+"""add connection composite indexes
+
+Revision ID: 7f3c9a1d4e02
+Revises: 0000
+Create Date: 2026-08-30 10:12:41.118204
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '7f3c9a1d4e02'
+down_revision = '0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY must run outside a transaction so index builds don't block
+    # writes to the connection table on busy deployments.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_connection_org_type_status',
+            'connection',
+            ['organization_id', 'integration_type', 'status'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_connection_org_short_name',
+            'connection',
+            ['organization_id', 'short_name'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_connection_org_short_name',
+            table_name='connection',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'idx_connection_org_type_status',
+            table_name='connection',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
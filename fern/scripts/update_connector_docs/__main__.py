@@ -3,7 +3,7 @@
 import os
 
 from .constants import DOCS_CONNECTORS_DIR
-from .generators.mdx_generator import generate_mdx_content
+from .generators.mdx_generator import iter_mdx_chunks
 from .parsers.auth_parser import parse_auth_config
 from .parsers.config_parser import parse_config_file
 from .parsers.entity_parser import parse_entity_file
@@ -47,8 +47,9 @@ def main():
 
         valid_connectors.append(connector_name)
 
-        # Generate MDX content with both auth and config information
-        mdx_content = generate_mdx_content(
+        # Generate MDX content lazily with both auth and config information;
+        # update_or_create_mdx streams the chunks straight to disk for new files
+        mdx_content = iter_mdx_chunks(
             connector_name, entity_info, source_info, auth_configs, config_configs
         )
 
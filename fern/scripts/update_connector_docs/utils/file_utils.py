@@ -255,10 +255,18 @@ def update_docs_yml(valid_connectors):
 
 
 def update_or_create_mdx(connector_name, connector_docs_dir, mdx_content):
-    """Create or update main.mdx file for a connector."""
+    """Create or update main.mdx file for a connector.
+
+    ``mdx_content`` may be a string or an iterable of string chunks (as yielded
+    by iter_mdx_chunks); new files are written by streaming the chunks straight
+    to disk, existing files are spliced and need the joined string.
+    """
     # Create connector docs directory if it doesn't exist
     os.makedirs(connector_docs_dir, exist_ok=True)
 
+    streamable = not isinstance(mdx_content, str)
+    mdx_chunks = mdx_content if streamable else None
+
     # Create or update main.mdx
     main_mdx_path = connector_docs_dir / "main.mdx"
 
@@ -274,6 +282,10 @@ description: "{display_name} integration with Airweave"
 """
 
     if main_mdx_path.exists():
+        # Splicing into an existing file needs the full document in memory
+        if streamable:
+            mdx_content = "".join(mdx_chunks)
+
         # If file exists, preserve custom content and update only auto-generated part
         with open(main_mdx_path, "r") as f:
             existing_content = f.read()
@@ -311,7 +323,11 @@ description: "{display_name} integration with Airweave"
     else:
         # Create the file with the frontmatter and generated content
         with open(main_mdx_path, "w") as f:
-            f.write(frontmatter + mdx_content)
+            f.write(frontmatter)
+            if streamable:
+                f.writelines(mdx_chunks)
+            else:
+                f.write(mdx_content)
 
         print(f"  Created new main.mdx for {connector_name}")
 
@@ -396,8 +396,8 @@ class AirtableBongo(BaseBongo):
         Uses a lock to prevent race conditions when multiple tasks are running concurrently.
         """
         async with self._rate_limit_lock:
-            now = time.time()
+            now = time.monotonic()
             delta = now - self.last_request_time
             if delta < self.rate_limit_delay:
                 await asyncio.sleep(self.rate_limit_delay - delta)
-            self.last_request_time = time.time()
+            self.last_request_time = time.monotonic()
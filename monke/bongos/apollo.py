@@ -71,11 +71,11 @@ class ApolloBongo(BaseBongo):
 
     async def _rate_limit(self) -> None:
         """Simple rate limiting."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def create_entities(self) -> List[Dict[str, Any]]:
         """Create accounts and contacts in Apollo with embedded tokens.
@@ -430,8 +430,8 @@ class AsanaBongo(BaseBongo):
         }
 
     async def _rate_limit(self):
-        now = time.time()
+        now = time.monotonic()
         delta = now - self.last_request_time
         if delta < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
@@ -74,11 +74,11 @@ class AttioBongo(BaseBongo):
 
     async def _rate_limit(self):
         """Simple rate limiting to avoid hitting API limits."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _ensure_workspace(self):
         """No-op: Attio API doesn't require workspace ID for record creation."""
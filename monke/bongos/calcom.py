@@ -87,11 +87,11 @@ class CalComBongo(BaseBongo):
 
     async def _rate_limit(self):
         """Simple client-side rate limiting."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.min_delay:
             await asyncio.sleep(self.min_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _get_available_slot_starts(
         self,
@@ -654,11 +654,11 @@ class ClickUpBongo(BaseBongo):
 
     async def _rate_limit(self):
         """Simple rate limiting to avoid hitting ClickUp API limits."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _get_with_retry(self, client: httpx.AsyncClient, url: str, retries: int = 3) -> Dict:
         """Make GET request with retry logic."""
@@ -31,11 +31,11 @@ class CodaBongo(BaseBongo):
         self.logger = get_logger("coda_bongo")
 
     async def _rate_limit(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self._last_request_time
         if elapsed < RATE_LIMIT_DELAY:
             await asyncio.sleep(RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        self._last_request_time = time.monotonic()
 
     async def _request(
         self,
@@ -43,11 +43,11 @@ class FreshdeskBongo(BaseBongo):
         return httpx.BasicAuth(username=self.api_key, password="X")
 
     async def _rate_limit(self):
-        now = time.time()
+        now = time.monotonic()
         delta = now - self.last_request_time
         if delta < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def create_entities(self) -> List[Dict[str, Any]]:
         """Create tickets in Freshdesk via POST /api/v2/tickets."""
@@ -888,11 +888,11 @@ This is a plain text file for testing various content types and ensuring proper
 
     async def _rate_limit(self):
         """Implement rate limiting for GitHub API."""
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last = current_time - self.last_request_time
 
         if time_since_last < self.rate_limit_delay:
             sleep_time = self.rate_limit_delay - time_since_last
             await asyncio.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
@@ -431,11 +431,11 @@ class GoogleCalendarBongo(BaseBongo):
 
     async def _rate_limit(self):
         """Simple spacing between calls."""
-        now = time.time()
+        now = time.monotonic()
         dt = now - self.last_request_time
         if dt < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - dt)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _request_with_retry(
         self,
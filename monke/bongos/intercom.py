@@ -56,11 +56,11 @@ class IntercomBongo(BaseBongo):
         }
 
     async def _rate_limit(self):
-        now = time.time()
+        now = time.monotonic()
         delta = now - self.last_request_time
         if delta < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _get_ticket_type_id(self, client: httpx.AsyncClient) -> Optional[str]:
         """Get first available ticket type ID (required to create tickets)."""
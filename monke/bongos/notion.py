@@ -51,7 +51,7 @@ class NotionBongo(BaseBongo):
     ) -> Dict[str, Any]:
         """Make a rate-limited request to the Notion API."""
         # Simple rate limiting
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last = current_time - self._last_request_time
         if time_since_last < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - time_since_last)
@@ -76,7 +76,7 @@ class NotionBongo(BaseBongo):
                 json_data = {"archived": True}
                 response = await client.patch(url, headers=headers, json=json_data)
 
-            self._last_request_time = time.time()
+            self._last_request_time = time.monotonic()
 
             if response.status_code >= 400:
                 self.logger.error(
@@ -170,7 +170,7 @@ class OutlookCalendarBongo(BaseBongo):
         return {"Authorization": f"Bearer {self.access_token}", "Content-Type": "application/json"}
 
     async def _pace(self):
-        now = time.time()
+        now = time.monotonic()
         if (delta := now - self._last_req) < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self._last_req = time.time()
+        self._last_req = time.monotonic()
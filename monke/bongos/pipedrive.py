@@ -59,10 +59,10 @@ class PipedriveBongo(BaseBongo):
 
     async def _pace(self):
         """Rate limiting helper."""
-        now = time.time()
+        now = time.monotonic()
         if (delta := now - self._last_req) < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self._last_req = time.time()
+        self._last_req = time.monotonic()
 
     async def _get_pipeline(self, client: httpx.AsyncClient) -> tuple[int, int]:
         """Get the first pipeline and stage for creating deals."""
@@ -379,7 +379,7 @@ class PowerPointBongo(BaseBongo):
 
     async def _pace(self):
         """Rate limiting helper."""
-        now = time.time()
+        now = time.monotonic()
         if (delta := now - self._last_req) < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self._last_req = time.time()
+        self._last_req = time.monotonic()
@@ -64,11 +64,11 @@ class ServiceNowBongo(BaseBongo):
         return f"{self.url}/api/now/table/{table}"
 
     async def _rate_limit(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def create_entities(self) -> List[Dict[str, Any]]:
         """Create incidents in ServiceNow with embedded verification tokens."""
@@ -77,11 +77,11 @@ class SlabBongo(BaseBongo):
         }
 
     async def _rate_limit(self):
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _graphql(
         self, client: httpx.AsyncClient, query: str, variables: Optional[Dict] = None
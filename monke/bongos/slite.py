@@ -65,11 +65,11 @@ class SliteBongo(BaseBongo):
 
     async def _rate_limit(self):
         """Simple rate limiting."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def _ensure_workspace(self):
         """No-op: Slite API does not require workspace ID for note creation."""
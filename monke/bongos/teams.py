@@ -592,8 +592,8 @@ class TeamsBongo(BaseBongo):
 
     async def _rate_limit(self):
         """Simple rate limiting."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_request_time
         if elapsed < self.min_delay:
             await asyncio.sleep(self.min_delay - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
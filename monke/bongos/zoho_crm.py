@@ -223,10 +223,10 @@ class ZohoCRMBongo(BaseBongo):
 
     async def _pace(self):
         """Respect API rate limits."""
-        now = time.time()
+        now = time.monotonic()
         if (delta := now - self._last_req) < self.rate_limit_delay:
             await asyncio.sleep(self.rate_limit_delay - delta)
-        self._last_req = time.time()
+        self._last_req = time.monotonic()
 
     async def _create_record(
         self, client: httpx.AsyncClient, module: str, payload: Dict[str, Any]
@@ -72,12 +72,12 @@ class TestFlow:
             },
         )
 
-        flow_start = time.time()
+        flow_start = time.monotonic()
         try:
             for step_idx, step_name in enumerate(self.config.test_flow.steps, 1):
                 await self._execute_step(step_name, step_idx, len(self.config.test_flow.steps))
 
-            total_duration = time.time() - flow_start
+            total_duration = time.monotonic() - flow_start
             self.context.metrics["total_duration_wall_clock"] = total_duration
 
             # Final summary
@@ -93,7 +93,7 @@ class TestFlow:
             await self._emit_event("flow_completed")
         except Exception as e:
             self.logger.error(f"❌ Test flow execution failed: {e}")
-            self.context.metrics["total_duration_wall_clock"] = time.time() - flow_start
+            self.context.metrics["total_duration_wall_clock"] = time.monotonic() - flow_start
             try:
                 await self.cleanup()
             except Exception as cleanup_error:
@@ -119,11 +119,11 @@ class TestFlow:
 
         # Pass both config and context to steps
         step = self.step_factory.create_step(step_name, self.config, self.context)
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             await step.execute()
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
 
             self.context.metrics[f"{idx:02d}_{step_name}_duration"] = duration
             self.logger.info(f"✅ Step {step_name} completed in {duration:.2f}s")
@@ -133,7 +133,7 @@ class TestFlow:
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             self.context.metrics[f"{idx:02d}_{step_name}_duration"] = duration
             self.context.metrics[f"{idx:02d}_{step_name}_failed"] = True
             await self._emit_event(
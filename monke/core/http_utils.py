@@ -1,8 +1,103 @@
 """Shared HTTP utilities for Monke test steps."""
 
+import atexit
 import os
-from typing import Any, Dict, Optional
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 import httpx
+import orjson
+
+MAX_RETRIES = 3
+
+# Statuses worth retrying: throttling and transient gateway failures.
+_RETRYABLE_STATUS = {429, 502, 503, 504}
+
+# Shared client so poll iterations and tool calls reuse pooled connections
+# instead of paying a fresh TCP+TLS handshake per request.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it lazily on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = httpx.Client(
+                    # HTTP/2 multiplexes the frequent small polling requests over
+                    # one connection and compresses their repeated headers (HPACK);
+                    # the long keepalive expiry keeps that connection warm across
+                    # the gaps between poll iterations.
+                    http2=True,
+                    timeout=httpx.Timeout(120.0, connect=10.0),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=16,
+                        max_connections=32,
+                        keepalive_expiry=300.0,
+                    ),
+                )
+                atexit.register(client.close)
+                _client = client
+    return _client
+
+# Opt-in TTL cache for GET responses, keyed on (base_url, path). During a polling
+# burst (several steps checking the same jobs endpoint within a second or two),
+# adjacent calls coalesce to a single backend round-trip per TTL window.
+_get_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_get_cache_lock = threading.Lock()
+
+# Singleflight bookkeeping: while one caller fetches a key, concurrent callers
+# for the same key wait on its event and then read the freshly cached result
+# instead of firing duplicate requests.
+_get_inflight: Dict[Tuple[str, str], threading.Event] = {}
+
+# Last ETag and parsed body per (base_url, path). Conditional GETs let the
+# backend answer an unchanged poll with an empty 304 instead of the full
+# payload, and let us skip re-parsing the body on our side.
+_etag_cache: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+_etag_cache_lock = threading.Lock()
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Whether a request failure is transient and worth retrying.
+
+    Transport-level failures (timeouts, connection resets) and
+    throttling/gateway statuses can succeed on retry; any other 4xx means the
+    request itself is wrong, so retrying only wastes round-trips.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Backoff delay for a retry, preferring the server's Retry-After when sent."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return min(2.0**attempt, 10.0) + random.random()
+
+
+def _request_with_retries(send: Callable[[], httpx.Response]) -> httpx.Response:
+    """Send a request, retrying transient failures with exponential backoff."""
+    for attempt in range(MAX_RETRIES):
+        try:
+            resp = send()
+            # 304 is the expected answer to a conditional GET, not an error.
+            if resp.status_code != 304:
+                resp.raise_for_status()
+            return resp
+        except Exception as exc:
+            if not is_retryable(exc) or attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(_retry_delay(exc, attempt))
 
 
 def get_headers() -> Dict[str, str]:
@@ -19,11 +114,73 @@ def get_base_url() -> str:
     return os.getenv("AIRWEAVE_API_URL", "http://localhost:8001").rstrip("/")
 
 
-def http_get(path: str, timeout: float = 120.0) -> Any:
-    """Perform HTTP GET request to Airweave API."""
-    resp = httpx.get(f"{get_base_url()}{path}", headers=get_headers(), timeout=timeout)
-    resp.raise_for_status()
-    return resp.json()
+def http_get(path: str, timeout: float = 120.0, ttl_seconds: float = 0.0) -> Any:
+    """Perform HTTP GET request to Airweave API.
+
+    When ``ttl_seconds`` > 0, the parsed response is cached per (base_url, path)
+    and returned for subsequent calls within the TTL window. The default of 0
+    bypasses the cache entirely, so callers must opt in per call site.
+    """
+    key = (get_base_url(), path)
+    if ttl_seconds > 0:
+        while True:
+            with _get_cache_lock:
+                cached = _get_cache.get(key)
+                if cached and time.monotonic() - cached[0] < ttl_seconds:
+                    return cached[1]
+                inflight = _get_inflight.get(key)
+                if inflight is None:
+                    # We are the leader for this key; fetch below.
+                    done = threading.Event()
+                    _get_inflight[key] = done
+                    break
+            # Another caller is already fetching this key; wait for it, then
+            # re-check the cache (and take over as leader if it failed).
+            inflight.wait(timeout)
+
+        try:
+            data = _do_get(path, timeout)
+            with _get_cache_lock:
+                # Stamp after the request completes so the TTL bounds staleness,
+                # not staleness plus request latency.
+                _get_cache[key] = (time.monotonic(), data)
+            return data
+        finally:
+            with _get_cache_lock:
+                _get_inflight.pop(key, None)
+            done.set()
+
+    return _do_get(path, timeout)
+
+
+def _do_get(path: str, timeout: float) -> Any:
+    """Perform the actual GET round-trip and parse the response.
+
+    Sends ``If-None-Match`` when a previous response for the same path carried
+    an ETag; a 304 answer reuses the previously parsed body.
+    """
+    key = (get_base_url(), path)
+    with _etag_cache_lock:
+        cached = _etag_cache.get(key)
+
+    headers = get_headers()
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    resp = _request_with_retries(
+        lambda: get_client().get(f"{get_base_url()}{path}", headers=headers, timeout=timeout)
+    )
+    if resp.status_code == 304 and cached:
+        return cached[1]
+
+    # orjson decodes large job/connection payloads several times faster than
+    # the stdlib parser httpx uses for resp.json()
+    data = orjson.loads(resp.content)
+    etag = resp.headers.get("ETag")
+    if etag:
+        with _etag_cache_lock:
+            _etag_cache[key] = (etag, data)
+    return data
 
 
 def http_post(
@@ -33,20 +190,21 @@ def http_post(
     timeout: float = 120.0,
 ) -> Any:
     """Perform HTTP POST request to Airweave API."""
-    resp = httpx.post(
-        f"{get_base_url()}{path}",
-        headers=get_headers(),
-        json=json,
-        params=params,
-        timeout=timeout,
+    resp = _request_with_retries(
+        lambda: get_client().post(
+            f"{get_base_url()}{path}",
+            headers=get_headers(),
+            json=json,
+            params=params,
+            timeout=timeout,
+        )
     )
-    resp.raise_for_status()
-    return resp.json()
+    return orjson.loads(resp.content)
 
 
 def http_delete(path: str, timeout: float = 120.0) -> httpx.Response:
     """Perform HTTP DELETE request to Airweave API."""
-    return httpx.delete(
+    return get_client().delete(
         f"{get_base_url()}{path}",
         headers=get_headers(),
         timeout=timeout,
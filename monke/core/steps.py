@@ -2,9 +2,10 @@
 
 import asyncio
 import os
+import random
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from monke.core.config import TestConfig
 from monke.core.context import TestContext
@@ -12,6 +13,20 @@ from monke.core import http_utils
 from monke.utils.logging import get_logger
 
 
+def _poll_delays(cap: float = 15.0) -> Iterator[float]:
+    """Yield poll delays: short probes first, then exponential growth with jitter.
+
+    The first few probes stay short so fast syncs resolve fast; after that the
+    delay grows by 1.5x up to ``cap``, with up to 1s of jitter so concurrent
+    waiters don't align their polling cadence.
+    """
+    yield from (1.0, 2.0, 3.0)
+    delay = 3.0
+    while True:
+        delay = min(delay * 1.5, cap)
+        yield delay + random.uniform(0.0, 1.0)
+
+
 class TestStep(ABC):
     """Abstract base class for test steps."""
 
@@ -180,9 +195,12 @@ class SyncStep(TestStep):
 
     def _get_jobs(self) -> List[Dict[str, Any]]:
         """Get list of sync jobs for the source connection, sorted by recency."""
+        # Short TTL so back-to-back lookups (active-job probe, latest-job probe,
+        # completion poll) within the same second share one backend call.
         jobs = (
             http_utils.http_get(
-                f"/source-connections/{self.context.source_connection_id}/jobs"
+                f"/source-connections/{self.context.source_connection_id}/jobs",
+                ttl_seconds=1.0,
             )
             or []
         )
@@ -226,24 +244,26 @@ class SyncStep(TestStep):
         # Still no job? Wait for one to appear
         if not target_job_id:
             self.logger.info("ℹ️ No job id available; waiting for new job...")
-            start = time.monotonic()
+            deadline = time.monotonic() + timeout_seconds
             prev_latest = self.context.last_sync_job_id
+            delays = _poll_delays()
 
-            while time.monotonic() - start < timeout_seconds:
+            while time.monotonic() < deadline:
                 # Try to get latest job
                 latest_id = self._get_latest_job_id()
                 if latest_id and latest_id != prev_latest:
                     target_job_id = latest_id
                     self.logger.info(f"🆔 Detected sync job id: {target_job_id}")
                     break
-                await asyncio.sleep(2.0)
+                await asyncio.sleep(next(delays))
 
             if not target_job_id:
                 raise RuntimeError("Couldn't obtain a sync job id to wait on.")
 
         # Poll for job completion
-        start = time.monotonic()
-        while time.monotonic() - start < timeout_seconds:
+        deadline = time.monotonic() + timeout_seconds
+        delays = _poll_delays()
+        while time.monotonic() < deadline:
             # Find the job in our jobs list
             job = None
             try:
@@ -253,10 +273,10 @@ class SyncStep(TestStep):
                         job = j
                         break
             except Exception as e:
-                self.logger.warning(f"⚠️ Error fetching job status: {e}")
+                self.logger.debug("⚠️ Error fetching job status: %s", e)
 
             if not job:
-                await asyncio.sleep(2.0)
+                await asyncio.sleep(next(delays))
                 continue
 
             # Check job status
@@ -264,8 +284,10 @@ class SyncStep(TestStep):
             completed_at = job.get("completed_at")
             error = job.get("error")
 
-            self.logger.info(
-                f"🔍 Job {target_job_id} status={status}, completed_at={completed_at}"
+            # Per-iteration noise; lazy %s-formatting so a disabled DEBUG level
+            # skips the string interpolation entirely.
+            self.logger.debug(
+                "🔍 Job %s status=%s, completed_at=%s", target_job_id, status, completed_at
             )
 
             # Check for failure
@@ -284,7 +306,7 @@ class SyncStep(TestStep):
 
             # Still running
             if status in ACTIVE_STATUSES:
-                await asyncio.sleep(2.0)
+                await asyncio.sleep(next(delays))
                 continue
 
             # Unexpected state